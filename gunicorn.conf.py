@@ -0,0 +1,24 @@
+"""Gunicorn configuration for production.
+
+Run with: gunicorn -c gunicorn.conf.py server:app
+
+The request handlers are I/O-bound (almost all of their time is spent waiting
+on MongoDB round-trips), so gevent workers let each process overlap hundreds
+of in-flight requests instead of blocking on one at a time.
+"""
+
+bind = "0.0.0.0:5000"
+worker_class = "gevent"
+workers = 2
+worker_connections = 500
+
+
+def post_worker_init(worker):
+    # Each worker gets its own MongoDB connection pool; warm it here so the
+    # worker's first real request doesn't pay the TLS handshake. This must be
+    # post_worker_init, not post_fork: post_fork runs before the gevent worker
+    # monkey-patches the stdlib, so importing the app there would open the
+    # pool on native blocking sockets and every Mongo call would stall the
+    # event loop.
+    from server import warm_connection_pool
+    warm_connection_pool()
@@ -38,6 +38,7 @@ function showMessage(message, isSuccess = true) {
  * @returns {Promise<object>} The parsed JSON response.
  */
 async function fetchWithBackoff(url, options, retries = 3) {
+    let triedRefresh = false;
     for (let i = 0; i < retries; i++) {
         try {
             const response = await fetch(url, options);
@@ -56,6 +57,18 @@ async function fetchWithBackoff(url, options, retries = 3) {
             return data;
 
         } catch (error) {
+            // Access tokens are short-lived; try one transparent refresh
+            // before treating the failure as a dead session.
+            if (!triedRefresh && error.message.includes('Token is invalid')) {
+                triedRefresh = true;
+                if (await refreshAccessToken()) {
+                    if (options.headers && options.headers.Authorization) {
+                        options.headers.Authorization = `Bearer ${localStorage.getItem('userToken')}`;
+                    }
+                    i--; // Retry immediately without consuming a backoff attempt
+                    continue;
+                }
+            }
             console.error(`Attempt ${i + 1} failed for ${options.method} ${url}: ${error.message}`);
             if (i === retries - 1) {
                 throw new Error(`Failed to connect/process request: ${error.message}`);
@@ -123,8 +136,9 @@ async function handleLogin(event) {
             body: JSON.stringify({ email, password })
         });
 
-        // Store the JWT token from Flask response for subsequent API calls
+        // Store the JWT access token (short-lived) and refresh token
         localStorage.setItem('userToken', response.token);
+        localStorage.setItem('userRefreshToken', response.refresh_token);
         showMessage("Login successful! Welcome back.", true);
         toggleAppView(true);
 
@@ -138,11 +152,37 @@ async function handleLogin(event) {
  */
 function handleLogout() {
     localStorage.removeItem('userToken');
+    localStorage.removeItem('userRefreshToken');
     tasks = []; // Clear local tasks
     showMessage("You have been logged out.", true);
     toggleAppView(false);
 }
 
+/**
+ * Exchanges the stored refresh token for a new short-lived access token.
+ * @returns {Promise<boolean>} True if a new access token was obtained.
+ */
+async function refreshAccessToken() {
+    const refreshToken = localStorage.getItem('userRefreshToken');
+    if (!refreshToken) return false;
+
+    try {
+        const response = await fetch('/api/refresh', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ refresh_token: refreshToken })
+        });
+        const data = await response.json();
+        if (response.ok && data.success) {
+            localStorage.setItem('userToken', data.token);
+            return true;
+        }
+    } catch (error) {
+        console.error(`Token refresh failed: ${error.message}`);
+    }
+    return false;
+}
+
 /**
  * Utility to get the auth header for protected routes.
  */